@@ -15,6 +15,7 @@
 import sys
 import os
 import csv
+import json
 
 # FIXME: dachkuppel not recognized
 
@@ -28,6 +29,10 @@ CONSTANTS = {
     "KNX_CLASSIFIER_COVER": "jalousien",
     "KNX_CLASSIFIER_JALOUSIE": "jal",
     "KNX_CLASSIFIER_ROLLO": "rollo",
+    "KNX_CLASSIFIER_SWITCH": "steckdosen",
+    "KNX_CLASSIFIER_SENSOR": "messwerte",
+    "KNX_CLASSIFIER_BINARY_SENSOR": "meldungen",
+    "KNX_CLASSIFIER_CLIMATE": "heizung",
     # TODO: Add more KNX classifiers as needed
     "MOVE_LONG_ADDRESS": "Auf/Ab",
     "STOP_ADDRESS": "Stopp",
@@ -35,6 +40,12 @@ CONSTANTS = {
     "POSITION_ADDRESS": "Position",
     "ANGLE_STATE_ADDRESS": "Status Lamelle",
     "ANGLE_ADDRESS": "Lamelle",
+    "SWITCH_ADDRESS": "Schalten",
+    "SWITCH_STATE_ADDRESS": "Status",
+    "TEMPERATURE_ADDRESS": "Ist-Temperatur",
+    "TARGET_TEMPERATURE_ADDRESS": "Sollwert",
+    "TARGET_TEMPERATURE_STATE_ADDRESS": "Status Sollwert",
+    "DEFAULT_SENSOR_TYPE": "temperature", # Home Assistant KNX sensor type, can be overridden in config
     "STANDARD_TRAVELLING_TIME_LONG": 60, # Default travelling time for long covers in seconds, can be overridden in config
     "STANDARD_TRAVELLING_TIME_SHORT": 30, # Default travelling time for short covers in seconds, can be overridden in config
 }
@@ -61,10 +72,10 @@ def print_logo():
 
 # Function to display usage instructions
 def usage():
-    print("Usage: python convert_esf_to_csv.py <inputfile.esf> [outputfile] [csv|ha|yaml]")
+    print("Usage: python convert_esf_to_csv.py <inputfile.esf> [outputfile] [csv|ha|yaml|buttons|json|jsonl]")
     print("  <inputfile.esf> : Input ESF file (required, must end with .esf)")
-    print("  [outputfile]    : Output file name (optional, ends with .csv for csv mode, .txt for ha, .yaml for yaml mode, .txt for buttons mode)")
-    print("  [csv|ha|yaml|buttons]   : Output format (optional, default is ha)")
+    print("  [outputfile]    : Output file name (optional, ends with .csv for csv mode, .txt for ha, .yaml for yaml mode, .txt for buttons mode, .json for json mode, .jsonl for jsonl mode)")
+    print("  [csv|ha|yaml|buttons|json|jsonl]   : Output format (optional, default is ha)")
     print("  [namesfile]     : Custom names file (optional, must be .csv file and called names.csv)")
     print("  [configfile]    : Custom configuration file (optional, must be .csv file and called config.csv)")
     print()
@@ -164,12 +175,10 @@ def validate_names_file(names_file_path):
          
     return names_content
 
-# Function to parse the ESF file and extract address and name pairs
-def parse_esf(input_path, valid_names=None):
+# Function to parse the ESF file and yield (line number, row) pairs as they are read
+def iter_esf(input_path, valid_names=None):
     global config
     
-    rows = []
-    
     # Try to open the file with different encodings
     encodings_to_try = ["utf-8", "utf-8-sig", "latin1"]
     esf_file = None
@@ -187,7 +196,7 @@ def parse_esf(input_path, valid_names=None):
             continue
     if esf_file is None:
         print(f"Error: Could not decode file '{input_path}' with utf-8, utf-8-sig, or latin1.")
-        return rows
+        return
     
     counter = 0
     for line in esf_file:
@@ -208,20 +217,12 @@ def parse_esf(input_path, valid_names=None):
         if len(first_col) < 2:
             continue
         
-        # Determine classification based on rules
+        # Determine classification based on the registered entity types
         second_col = parts[1].lower() if len(parts) > 1 else ""
-        if config["KNX_CLASSIFIER_LIGHT"] in first_col[0].lower():
-            # Skip if the original name starts with "st/"
-            if any(parts[1].strip().lower().startswith(prefix) for prefix in ("w/", "rd/", "st/", "st_w/")):
-                continue
-            classification = "beleuchtung"
-        elif config["KNX_CLASSIFIER_COVER"] in first_col[0].lower() and config["KNX_CLASSIFIER_JALOUSIE"] in second_col:
-            classification = "jalousie"
-        elif config["KNX_CLASSIFIER_COVER"] in first_col[0].lower() and config["KNX_CLASSIFIER_ROLLO"] in second_col:
-            classification = "rollo"
-        else:
-            classification = "unknown"
-        # TODO: Add more classification rules as needed
+        classification = classify_row(first_col[0].lower(), second_col)
+        # Skip if the original name of a light starts with "st/"
+        if classification == "beleuchtung" and any(parts[1].strip().lower().startswith(prefix) for prefix in ("w/", "rd/", "st/", "st_w/")):
+            continue
         
         address = first_col[-1]
         action = first_col[-2]
@@ -250,10 +251,13 @@ def parse_esf(input_path, valid_names=None):
             else:
                 name = clean_name(parts[1])
             
-        rows.append((address, name, classification, action))
+        yield counter, (address, name, classification, action)
         
     esf_file.close()
-    return rows
+
+# Function to parse the ESF file and extract address and name pairs
+def parse_esf(input_path, valid_names=None):
+    return [row for _, row in iter_esf(input_path, valid_names)]
     
 # Load configuration from a file or environment variables
 def load_config(config_file):
@@ -325,6 +329,214 @@ def load_config(config_file):
     config_fh.close()
     return prod_constants
 
+###### Entity Types ######
+# Helper to strip the last word of a name (e.g. "Küche Jal" -> "Küche")
+def remove_last_word(name):
+    return name.rsplit(' ', 1)[0] if ' ' in name else name
+
+# Helper to find the address of a grouped entity by action substring
+def find_address(rows, substring, notsubstring=None):
+    for address, _, _, action in rows:
+        if substring in action and (not notsubstring or notsubstring not in action):
+            return address
+    return "MISSING"
+
+# Function to format entity names as in Home Assistant config
+def format_button_name(name):
+    # Format the name as in Home Assistant config, but convert German umlauts
+    name = name.replace(' ', '_').lower()
+    name = name.replace('.', '_')
+    name = name.replace('/', '_')
+    name = name.replace('ä', 'a').replace('ö', 'o').replace('ü', 'u')
+    # If 'jal' or 'rollo' is in the name, cut off after that word (inclusive)
+    for keyword in ("jal", "rollo"):
+        idx = name.find(keyword)
+        if idx != -1:
+            name = name[:idx + len(keyword)]
+            break
+    return name
+
+# Classification rules: return the classification of a row or None if the rule does not match
+def classify_light(main_group, name):
+    if config["KNX_CLASSIFIER_LIGHT"] in main_group:
+        return "beleuchtung"
+    return None
+
+def classify_cover(main_group, name):
+    if config["KNX_CLASSIFIER_COVER"] in main_group and config["KNX_CLASSIFIER_JALOUSIE"] in name:
+        return "jalousie"
+    if config["KNX_CLASSIFIER_COVER"] in main_group and config["KNX_CLASSIFIER_ROLLO"] in name:
+        return "rollo"
+    return None
+
+def classify_switch(main_group, name):
+    if config["KNX_CLASSIFIER_SWITCH"] in main_group:
+        return "schalter"
+    return None
+
+def classify_sensor(main_group, name):
+    if config["KNX_CLASSIFIER_SENSOR"] in main_group:
+        return "messwert"
+    return None
+
+def classify_binary_sensor(main_group, name):
+    if config["KNX_CLASSIFIER_BINARY_SENSOR"] in main_group:
+        return "meldung"
+    return None
+
+def classify_climate(main_group, name):
+    if config["KNX_CLASSIFIER_CLIMATE"] in main_group:
+        return "heizung"
+    return None
+
+# Address roles: resolve the Home Assistant address keys of an entity from its rows
+def addresses_single(rows):
+    return {"address": rows[0][0]}
+
+def addresses_state(rows):
+    return {"state_address": rows[0][0]}
+
+def addresses_cover(rows):
+    return {
+        "move_long_address": find_address(rows, config["MOVE_LONG_ADDRESS"]),
+        "stop_address": find_address(rows, config["STOP_ADDRESS"]),
+        "position_address": find_address(rows, config["POSITION_ADDRESS"], notsubstring=config["POSITION_STATE_ADDRESS"]),
+        "position_state_address": find_address(rows, config["POSITION_STATE_ADDRESS"]),
+        "angle_address": find_address(rows, config["ANGLE_ADDRESS"], notsubstring=config["ANGLE_STATE_ADDRESS"]),
+        "angle_state_address": find_address(rows, config["ANGLE_STATE_ADDRESS"]),
+    }
+
+def addresses_switch(rows):
+    return {
+        "address": find_address(rows, config["SWITCH_ADDRESS"], notsubstring=config["SWITCH_STATE_ADDRESS"]),
+        "state_address": find_address(rows, config["SWITCH_STATE_ADDRESS"]),
+    }
+
+def addresses_climate(rows):
+    return {
+        "temperature_address": find_address(rows, config["TEMPERATURE_ADDRESS"]),
+        "target_temperature_address": find_address(rows, config["TARGET_TEMPERATURE_ADDRESS"], notsubstring=config["TARGET_TEMPERATURE_STATE_ADDRESS"]),
+        "target_temperature_state_address": find_address(rows, config["TARGET_TEMPERATURE_STATE_ADDRESS"]),
+    }
+
+# YAML templates: return the Home Assistant YAML entry of an entity
+def yaml_entity(entity):
+    yaml_content = f'    - name: "{entity["name"]}"\n'
+    for key, address in entity["addresses"].items():
+        yaml_content += f'      {key}: "{address}"\n'
+    return yaml_content
+
+def yaml_cover(entity):
+    addresses = entity["addresses"]
+    yaml_content = f'    - name: "{entity["name"]}"\n'
+    yaml_content += f'      move_long_address: "{addresses["move_long_address"]}"\n'
+    yaml_content += f'      move_short_address: "{addresses["stop_address"]}"\n'
+    yaml_content += f'      stop_address: "{addresses["stop_address"]}"\n'
+    yaml_content += f'      position_address: "{addresses["position_address"]}"\n'
+    yaml_content += f'      position_state_address: "{addresses["position_state_address"]}"\n'
+    # Add angle addresses only for jalousie covers
+    if entity["classification"] == "jalousie":
+        yaml_content += f'      angle_address: "{addresses["angle_address"]}"\n'
+        yaml_content += f'      angle_state_address: "{addresses["angle_state_address"]}"\n'
+    # TODO: Add travelling time based on size
+    yaml_content += f'      travelling_time_down: "{config["STANDARD_TRAVELLING_TIME_LONG"]}"\n'
+    yaml_content += f'      travelling_time_up: "{config["STANDARD_TRAVELLING_TIME_LONG"]}"\n'
+    return yaml_content
+
+def yaml_sensor(entity):
+    return yaml_entity(entity) + f'      type: "{config["DEFAULT_SENSOR_TYPE"]}"\n'
+
+# Button templates: return the dashboard card of an entity
+def button_light(entity):
+    return f'- type: button\n  show_icon: true\n  show_name: true\n  entity: light.{format_button_name(entity["name"])}\n'
+
+def button_cover(entity):
+    if entity["classification"] == "jalousie":
+        return f'- type: tile\n  entity: cover.{format_button_name(entity["name"])}\n  features_position: bottom\n  vertical: false\n'
+    return f'- type: entity\n  entity: cover.{format_button_name(entity["name"])}\n'
+
+def button_switch(entity):
+    return f'- type: button\n  show_icon: true\n  show_name: true\n  entity: switch.{format_button_name(entity["name"])}\n'
+
+def button_sensor(entity):
+    return f'- type: entity\n  entity: sensor.{format_button_name(entity["name"])}\n'
+
+def button_binary_sensor(entity):
+    return f'- type: entity\n  entity: binary_sensor.{format_button_name(entity["name"])}\n'
+
+def button_climate(entity):
+    return f'- type: thermostat\n  entity: climate.{format_button_name(entity["name"])}\n'
+
+# Registry of supported KNX entity types, in output order.
+# "group_name" maps a row name to the name of the entity it belongs to; None means one entity per row.
+ENTITY_TYPES = [
+    {"platform": "light", "title": "lights", "classifications": ("beleuchtung",), "classify": classify_light, "group_name": None,
+     "addresses": addresses_single, "yaml": yaml_entity, "button": button_light},
+    {"platform": "cover", "title": "covers", "classifications": ("jalousie", "rollo"), "classify": classify_cover, "group_name": remove_last_word,
+     "addresses": addresses_cover, "yaml": yaml_cover, "button": button_cover},
+    {"platform": "switch", "title": "switches", "classifications": ("schalter",), "classify": classify_switch, "group_name": str.strip,
+     "addresses": addresses_switch, "yaml": yaml_entity, "button": button_switch},
+    {"platform": "sensor", "title": "sensors", "classifications": ("messwert",), "classify": classify_sensor, "group_name": None,
+     "addresses": addresses_state, "yaml": yaml_sensor, "button": button_sensor},
+    {"platform": "binary_sensor", "title": "binary sensors", "classifications": ("meldung",), "classify": classify_binary_sensor, "group_name": None,
+     "addresses": addresses_state, "yaml": yaml_entity, "button": button_binary_sensor},
+    {"platform": "climate", "title": "climate", "classifications": ("heizung",), "classify": classify_climate, "group_name": str.strip,
+     "addresses": addresses_climate, "yaml": yaml_entity, "button": button_climate},
+]
+
+# Function to classify a row by the first matching entity type
+def classify_row(main_group, name):
+    for entity_type in ENTITY_TYPES:
+        classification = entity_type["classify"](main_group, name)
+        if classification:
+            return classification
+    return "unknown"
+
+# Function to group (line number, row) pairs into entities in a single pass.
+# Ungrouped entities are yielded as soon as their row is read, grouped entities
+# (e.g. covers) once all rows are consumed, sorted by name.
+def iter_entities(numbered_rows):
+    # Map classifications to their entity type once, so each row needs a single lookup
+    types_by_classification = {}
+    grouped = {}
+    for entity_type in ENTITY_TYPES:
+        for classification in entity_type["classifications"]:
+            types_by_classification[classification] = entity_type
+        grouped[entity_type["platform"]] = {}
+    
+    for line, row in numbered_rows:
+        classification = row[2]
+        entity_type = types_by_classification.get(classification)
+        if entity_type is None:
+            continue
+        
+        platform = entity_type["platform"]
+        if entity_type["group_name"] is None:
+            yield {"platform": platform, "name": row[1], "classification": classification, "line": line,
+                   "rows": [row], "addresses": entity_type["addresses"]([row])}
+        else:
+            name = entity_type["group_name"](row[1])
+            entity = grouped[platform].setdefault(name, {"platform": platform, "name": name, "classification": classification, "line": line, "rows": []})
+            entity["rows"].append(row)
+            # A cover with any jalousie row is treated as a jalousie
+            if classification == "jalousie":
+                entity["classification"] = "jalousie"
+    
+    # Resolve the address roles of the grouped entities once all their rows are known
+    for entity_type in ENTITY_TYPES:
+        platform = entity_type["platform"]
+        for name in sorted(grouped[platform]):
+            entity = grouped[platform][name]
+            entity["addresses"] = entity_type["addresses"](entity["rows"])
+            yield entity
+
+# Function to group the rows into entities per platform
+def group_entities(rows):
+    entities = {entity_type["platform"]: [] for entity_type in ENTITY_TYPES}
+    for entity in iter_entities((None, row) for row in rows):
+        entities[entity["platform"]].append(entity)
+    return entities
+
 ###### Option Functionality ######
 # Function to write the extracted data to a CSV file
 def write_csv(rows, output_path):
@@ -334,66 +546,43 @@ def write_csv(rows, output_path):
         for address, name, classification, action in rows:
             writer.writerow([address, name, classification, action])
             
+# Function to stream one JSON record per entity, as JSON Lines or as a JSON array
+def write_json(numbered_rows, output_path, json_lines=True):
+    with open(output_path, "w", encoding="utf-8", newline='\n') as json_file:
+        if not json_lines:
+            json_file.write("[\n")
+        first = True
+        for entity in iter_entities(numbered_rows):
+            record = {
+                "platform": entity["platform"],
+                "name": entity["name"],
+                "classification": entity["classification"],
+                "line": entity["line"],
+                # Missing role addresses are written as null instead of "MISSING"
+                "addresses": {key: (None if address == "MISSING" else address) for key, address in entity["addresses"].items()},
+            }
+            if json_lines:
+                json_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                json_file.write(("" if first else ",\n") + "  " + json.dumps(record, ensure_ascii=False))
+            first = False
+        if not json_lines:
+            json_file.write("\n]\n" if not first else "]\n")
+
 # Function to write the extracted data to Home Assistant YAML format
 def create_ha_yaml(rows):
-    global config
-    
     yaml_content = "knx:\n"
     
-    # Write the lights section
-    lights = [(address, name) for address, name, classification, action in rows if classification == "beleuchtung"]
-    if lights:
-        yaml_content += "  light:\n"
-        for address, name in lights:
-            yaml_content += f'    - name: "{name}"\n'
-            yaml_content += f'      address: "{address}"\n'
-            
-    yaml_content += "\n"
-            
-    # Write cover section
-    covers = [(address, name, classification, action) for address, name, classification, action in rows if classification in ("jalousie", "rollo")]
-    if covers:
-        yaml_content += "  cover:\n"
-        # Get unique names for covers
-        def remove_last_word(name):
-            return name.rsplit(' ', 1)[0] if ' ' in name else name
-
-        unique_names = sorted(set(remove_last_word(name) for _, name, _, _ in covers))
-        
-        # Iterate over unique cover names
-        for name in unique_names:
-            # Find all rows for this cover name
-            relevant_rows = [row for row in covers if name in row[1]]
-            # Helper to find address by action substring
-            def find_address(substring, notsubstring=None):
-                for address, _, _, action in relevant_rows:
-                    if substring in action and (not notsubstring or notsubstring not in action):
-                        return address
-                return "MISSING"
-            
-            move_long_address = find_address(config["MOVE_LONG_ADDRESS"])
-            stop_address = find_address(config["STOP_ADDRESS"])
-            position_state_address = find_address(config["POSITION_STATE_ADDRESS"])
-            position_address = find_address(config["POSITION_ADDRESS"], notsubstring=config["POSITION_STATE_ADDRESS"])
-            angle_state_address = find_address(config["ANGLE_STATE_ADDRESS"])
-            angle_address = find_address(config["ANGLE_ADDRESS"], notsubstring=config["ANGLE_STATE_ADDRESS"])
-            
-            yaml_content += f'    - name: "{name}"\n'
-            yaml_content += f'      move_long_address: "{move_long_address}"\n'
-            yaml_content += f'      move_short_address: "{stop_address}"\n'
-            yaml_content += f'      stop_address: "{stop_address}"\n'
-            yaml_content += f'      position_address: "{position_address}"\n'
-            yaml_content += f'      position_state_address: "{position_state_address}"\n'
-            # Add angle addresses only for jalousie covers
-            cover_classification = next((row[2] for row in relevant_rows), None)
-            if cover_classification == "jalousie":
-                yaml_content += f'      angle_address: "{angle_address}"\n'
-                yaml_content += f'      angle_state_address: "{angle_state_address}"\n'
-            # TODO: Add travelling time based on size
-            yaml_content += f'      travelling_time_down: "{config["STANDARD_TRAVELLING_TIME_LONG"]}"\n'
-            yaml_content += f'      travelling_time_up: "{config["STANDARD_TRAVELLING_TIME_LONG"]}"\n'
-            
-        # TODO: Add further knx entities if needed
+    # Write one section per entity type, in registry order
+    entities = group_entities(rows)
+    for entity_type in ENTITY_TYPES:
+        platform_entities = entities[entity_type["platform"]]
+        if not platform_entities:
+            continue
+        yaml_content += f"  {entity_type['platform']}:\n"
+        for entity in platform_entities:
+            yaml_content += entity_type["yaml"](entity)
+        yaml_content += "\n"
     
     return yaml_content
 
@@ -409,53 +598,16 @@ def write_ha_config(rows, output_path):
         
 # Function to write buttons for all KNX entities in yaml format
 def write_buttons_file(rows, output_path):
-    # Function to format button names as in Home Assistant config
-    def format_button_name(name):
-        # Format the name as in Home Assistant config, but convert German umlauts
-        name = name.replace(' ', '_').lower()
-        name = name.replace('.', '_')
-        name = name.replace('/', '_')
-        name = name.replace('ä', 'a').replace('ö', 'o').replace('ü', 'u')
-        # If 'jal' or 'rollo' is in the name, cut off after that word (inclusive)
-        for keyword in ("jal", "rollo"):
-            idx = name.find(keyword)
-            if idx != -1:
-                name = name[:idx + len(keyword)]
-                break
-        return name
+    entities = group_entities(rows)
     
     with open(output_path, "w", encoding="utf-8-sig", newline='\r\n') as txt_file:
         txt_file.write("##### Buttons for KNX entities #####\n")
         
-        # Write buttons for lights
-        txt_file.write("\n# Buttons for lights\n")
-        for address, name, classification, action in rows:
-            if classification == "beleuchtung":
-                txt_file.write(f'- type: button\n  show_icon: true\n  show_name: true\n  entity: light.{format_button_name(name)}\n')
-
-        # Write buttons for unique covers (jalousie, rollo)
-        txt_file.write("\n# Buttons for covers\n")
-        covers = [(address, name, classification, action) for address, name, classification, action in rows if classification in ("jalousie", "rollo")]
-        
-        # Get unique names for covers
-        def remove_last_word(name):
-            return name.rsplit(' ', 1)[0] if ' ' in name else name
-
-        unique_names = sorted(set(remove_last_word(name) for _, name, _, _ in covers))
-        
-        # Iterate over unique cover names and write buttons
-        for name in unique_names:
-            # Add cover specific buttons  
-            # Find all rows for this cover name
-            relevant_rows = [row for row in covers if remove_last_word(row[1]) == name]
-            # Determine if any of the relevant rows is a jalousie
-            cover_classification = next((row[2] for row in relevant_rows if row[2] == "jalousie"), "rollo")
-            if cover_classification == "jalousie":
-                txt_file.write(f'- type: tile\n  entity: cover.{format_button_name(name)}\n  features_position: bottom\n  vertical: false\n')
-            else:
-                txt_file.write(f'- type: entity\n  entity: cover.{format_button_name(name)}\n')
-        
-        # TODO: Add further knx entities if needed
+        # Write buttons per entity type, in registry order
+        for entity_type in ENTITY_TYPES:
+            txt_file.write(f"\n# Buttons for {entity_type['title']}\n")
+            for entity in entities[entity_type["platform"]]:
+                txt_file.write(entity_type["button"](entity))
 
 ###### Interactive Mode Functionality ######
 def interactive_mode():
@@ -469,13 +621,15 @@ def interactive_mode():
     print("2) Translate KNX ESF file to Home Assistant yaml config file for sub-config import.")
     print("3) Translate KNX ESF file to CSV.")
     print("4) Create buttons for all KNX entities in yaml format for manual copying.")
+    print("5) Export KNX entities as JSON Lines (one record per line).")
+    print("6) Export KNX entities as JSON.")
     # Add options here
     print("0) Exit.")
     
     # Loop until user chooses to exit
     try:
         while True:
-            choice = input("\nEnter your choice (0-4): ").strip()
+            choice = input("\nEnter your choice (0-6): ").strip()
             
             # Exit option
             if choice == "0":
@@ -483,7 +637,7 @@ def interactive_mode():
                 sys.exit(0)
                 
             # Handle options
-            elif choice in ("1", "2", "3", "4"):
+            elif choice in ("1", "2", "3", "4", "5", "6"):
                 # Optional: Load configuration
                 config = handle_interactive_config()
                 
@@ -566,6 +720,21 @@ def interactive_mode():
                     write_buttons_file(rows, output_path)
                     print(f"Creation complete. Output written to: {output_path}")
                     continue
+                
+                # Option: Export KNX entities as JSON Lines or JSON.
+                elif choice in ("5", "6"):
+                    extension = ".jsonl" if choice == "5" else ".json"
+                    output_path = input("Enter output file name (or leave blank for default): ").strip()
+                    if not output_path:
+                        output_path = os.path.join(os.path.dirname(input_path), f"{base}_entities{extension}")
+                    elif not output_path.lower().endswith(extension):
+                        print(f"Error: Output file must have {extension} extension for {extension[1:]} mode.")
+                        continue
+                    
+                    # Stream the entities straight from the ESF parser
+                    write_json(iter_esf(input_path, valid_names), output_path, json_lines=(choice == "5"))
+                    print(f"Export complete. Output written to: {output_path}")
+                    continue
             
             # If the choice is invalid, prompt again
             else:
@@ -595,7 +764,7 @@ def manual_mode():
     # Parse optional arguments in any order
     for arg in sys.argv[2:]:
         arg_lower = arg.lower()
-        if arg_lower in ("csv", "ha", "yaml", "buttons"):
+        if arg_lower in ("csv", "ha", "yaml", "buttons", "json", "jsonl"):
             output_format = arg_lower
         elif arg_lower == "names.csv":
             names_file = arg
@@ -623,6 +792,8 @@ def manual_mode():
             output_path = os.path.join(os.path.dirname(input_path), f"{base}_config.txt")
         elif output_format == "buttons":
             output_path = os.path.join(os.path.dirname(input_path), f"{base}_buttons.txt")
+        elif output_format in ("json", "jsonl"):
+            output_path = os.path.join(os.path.dirname(input_path), f"{base}_entities.{output_format}")
         else:  # yaml
             output_path = os.path.join(os.path.dirname(input_path), f"knx_config.yaml")
     else:
@@ -638,6 +809,9 @@ def manual_mode():
         if output_format == "buttons" and not output_path.lower().endswith('.txt'):
             print("Error: Output file must have .txt extension for buttons mode.")
             sys.exit(1)
+        if output_format in ("json", "jsonl") and not output_path.lower().endswith(f".{output_format}"):
+            print(f"Error: Output file must have .{output_format} extension for {output_format} mode.")
+            sys.exit(1)
             
     # Validate names file if provided
     valid_names = None
@@ -646,6 +820,12 @@ def manual_mode():
         if not valid_names:
             sys.exit(1)
     
+    # JSON formats stream the entities straight from the parser, all others need the full row list
+    if output_format in ("json", "jsonl"):
+        write_json(iter_esf(input_path, valid_names), output_path, json_lines=(output_format == "jsonl"))
+        print(f"Conversion complete. Output written to: {output_path}")
+        return
+    
     # Parse the ESF file and write to the specified output format
     rows = parse_esf(input_path, valid_names) if valid_names else parse_esf(input_path)
     
@@ -660,7 +840,7 @@ def manual_mode():
     elif output_format == "buttons":
         write_buttons_file(rows, output_path)
     else:
-        print(f"Error: Unsupported output format '{output_format}'. Supported formats are csv, ha, yaml, and buttons.")
+        print(f"Error: Unsupported output format '{output_format}'. Supported formats are csv, ha, yaml, buttons, json, and jsonl.")
         sys.exit(1)
 
     print(f"Conversion complete. Output written to: {output_path}")